@@ -1,6 +1,7 @@
 import pytest
 from django import forms
-from posts.models import Post
+from django.test import Client
+from posts.models import Group, Post
 
 
 class TestCreateView:
@@ -73,3 +74,55 @@ class TestCreateView:
         assert response.status_code == 200, (
             'Make sure that you display error messages in case of invalid `form` input on the `/create/` page'
         )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_create_view_post_updates_anonymous_feeds(self, user_client, user, group):
+        guest_client = Client()
+        urls = ['/', f'/group/{group.slug}/', f'/profile/{user.username}/']
+        for url in urls:
+            guest_client.get(url)
+
+        text = 'New post feed check!'
+        user_client.post('/create/', data={'text': text, 'group': group.id})
+        for url in urls:
+            html = guest_client.get(url).content.decode()
+            assert text in html, (
+                f'Make sure that anonymous users see the new post on the `{url}` page right after `/create/`'
+            )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_create_view_new_group_choice(self, user_client, user, group):
+        user_client.get('/create/')
+        new_group = Group.objects.create(title='Test group 2', slug='test-link-2', description='Test group description')
+
+        response = user_client.get('/create/')
+        choices = [str(value) for value, label in response.context['form'].fields['group'].choices]
+        assert str(new_group.id) in choices, (
+            'Make sure that the `group` field of the form on the `/create/` page offers newly created groups'
+        )
+
+        text = 'New post group choice test!'
+        user_client.post('/create/', data={'text': text, 'group': new_group.id})
+        post = Post.objects.filter(author=user, text=text, group=new_group).first()
+        assert post is not None, (
+            'Make sure that a post can be saved with a newly created group on the `/create/` page'
+        )
+
+        user_client.get('/create/')
+        deleted_group_id = group.id
+        group.delete()
+
+        response = user_client.get('/create/')
+        choices = [str(value) for value, label in response.context['form'].fields['group'].choices]
+        assert str(deleted_group_id) not in choices, (
+            'Make sure that the `group` field of the form on the `/create/` page does not offer deleted groups'
+        )
+
+        text = 'New post deleted group test!'
+        response = user_client.post('/create/', data={'text': text, 'group': deleted_group_id})
+        assert response.status_code == 200, (
+            'Make sure that the form on the `/create/` page shows an error for a deleted group'
+        )
+        assert not Post.objects.filter(text=text).exists(), (
+            'Make sure that a post is not saved with a deleted group on the `/create/` page'
+        )
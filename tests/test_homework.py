@@ -105,8 +105,11 @@ class TestPost:
             'Add an option to search by `text` in the admin interface'
         )
 
-        assert 'pub_date' in admin_model.list_filter, (
-            'Add a filter by `pub_date` in the admin interface'
+        assert (
+            'pub_date' in admin_model.list_filter
+            or admin_model.date_hierarchy == 'pub_date'
+        ), (
+            'Add a filter by `pub_date` (`list_filter` or `date_hierarchy`) in the admin interface'
         )
 
         assert hasattr(admin_model, 'empty_value_display'), (
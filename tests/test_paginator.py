@@ -1,5 +1,6 @@
 import pytest
 from django.core.paginator import Page, Paginator
+from posts.models import Group, Post
 
 pytestmark = [pytest.mark.django_db]
 
@@ -50,3 +51,85 @@ class TestGroupPaginatorView:
             'Make sure that the `paginator` variable of the `page_obj` object'
             ' on the `/profile/<username>/` page is of type `Paginator`'
         )
+
+    def test_group_paginator_second_page(self, client, few_posts_with_group):
+        response = client.get(f'/group/{few_posts_with_group.group.slug}/', {'page': 2})
+        assert response.status_code == 200, (
+            'Make sure that the `/group/<slug>/?page=2` page loads correctly'
+        )
+        page_obj = response.context['page_obj']
+        assert isinstance(page_obj, Page), (
+            'Make sure that the `page_obj` variable on the `/group/<slug>/?page=2` page is of type `Page`'
+        )
+        assert len(page_obj.object_list) == 10, (
+            'Make sure that the `/group/<slug>/?page=2` page shows the next 10 posts of the group'
+        )
+        assert page_obj.has_previous(), (
+            'Make sure that the `page_obj` on the `/group/<slug>/?page=2` page links to the previous page'
+        )
+        first_page = client.get(f'/group/{few_posts_with_group.group.slug}/').context['page_obj']
+        assert not set(p.pk for p in first_page.object_list) & set(p.pk for p in page_obj.object_list), (
+            'Make sure that the pages of `/group/<slug>/` do not repeat the same posts'
+        )
+        posts = list(first_page.object_list) + list(page_obj.object_list)
+        group_posts = Post.objects.filter(group=few_posts_with_group.group)
+        assert set(post.pk for post in posts) == set(group_posts.values_list('pk', flat=True)), (
+            'Make sure that the pages of `/group/<slug>/` together show every post of the group'
+        )
+        pub_dates = [post.pub_date for post in posts]
+        assert pub_dates == sorted(pub_dates, reverse=True), (
+            'Make sure that the pages of `/group/<slug>/` show the posts from newest to oldest'
+        )
+
+    def test_paginator_count_follows_post_changes(self, user_client, few_posts_with_group):
+        group = few_posts_with_group.group
+        author = few_posts_with_group.author
+        other_group = Group.objects.create(
+            title='Test group 2', slug='test-link-2', description='Test group description'
+        )
+        group_url = f'/group/{group.slug}/'
+        other_group_url = f'/group/{other_group.slug}/'
+        profile_url = f'/profile/{author.username}/'
+
+        def check_counts(expected, action):
+            for url, count in expected.items():
+                response = user_client.get(url)
+                assert response.context['page_obj'].paginator.count == count, (
+                    f'Make sure that the `paginator` on the `{url}` page counts all the posts {action}'
+                )
+
+        check_counts({group_url: 20, other_group_url: 0, profile_url: 20}, 'of the page')
+
+        user_client.post('/create/', data={'text': 'New post count test!', 'group': group.id})
+        check_counts(
+            {group_url: 21, other_group_url: 0, profile_url: 21},
+            'after a post was created on the `/create/` page'
+        )
+
+        user_client.post(
+            f'/posts/{few_posts_with_group.id}/edit/',
+            data={'text': few_posts_with_group.text, 'group': other_group.id}
+        )
+        check_counts(
+            {group_url: 20, other_group_url: 1, profile_url: 21},
+            'after a post was moved to another group on the `/posts/<post_id>/edit/` page'
+        )
+
+        Post.objects.get(pk=few_posts_with_group.pk).delete()
+        check_counts(
+            {group_url: 20, other_group_url: 0, profile_url: 20},
+            'after a post was deleted'
+        )
+
+    def test_index_paginator_after_post_delete(self, client, few_posts_with_group):
+        response = client.get('/')
+        newest = response.context['page_obj'].object_list[0]
+        newest_pk = newest.pk
+        newest.delete()
+        response = client.get('/')
+        assert newest_pk not in [post.pk for post in response.context['page_obj'].object_list], (
+            'Make sure that a deleted post disappears from the `/` page'
+        )
+        assert len(response.context['page_obj'].object_list) == 10, (
+            'Make sure that the `/` page still shows 10 posts after a post was deleted'
+        )
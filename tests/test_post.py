@@ -118,3 +118,38 @@ class TestPostEditView:
         assert response.url.startswith(f'/posts/{post_with_group.id}'), (
             'Make sure that you redirect the user to the post page `/posts/<post_id>/`'
         )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_post_edit_view_updates_feeds(self, user_client, post_with_group):
+        urls = [
+            '/',
+            f'/group/{post_with_group.group.slug}/',
+            f'/profile/{post_with_group.author.username}/',
+        ]
+        for url in urls:
+            user_client.get(url)
+
+        text = 'Post edit feed check!'
+        user_client.post(
+            f'/posts/{post_with_group.id}/edit/',
+            data={'text': text, 'group': post_with_group.group_id}
+        )
+        for url in urls:
+            html = user_client.get(url).content.decode()
+            assert text in html, (
+                f'Make sure that the `{url}` page shows the edited text of the post after `/posts/<post_id>/edit/`'
+            )
+
+        group = post_with_group.group
+        old_title = group.title
+        group.title = 'Renamed test group'
+        group.save()
+        html = user_client.get(f'/group/{group.slug}/').content.decode()
+        assert group.title in html, (
+            'Make sure that the `/group/<slug>/` page shows the new title of a renamed group'
+        )
+        for url in urls:
+            html = user_client.get(url).content.decode()
+            assert old_title not in html, (
+                f'Make sure that the `{url}` page does not show the old title of a renamed group'
+            )
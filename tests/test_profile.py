@@ -46,3 +46,10 @@ class TestProfileView:
         assert len(page_context.object_list) == 0, (
             'Make sure you added the correct author articles to the page context of `/profile/<username>/`'
         )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_profile_view_unknown_user(self, client):
+        response = client.get('/profile/unknown_user_87123478/')
+        assert response.status_code == 404, (
+            'Make sure that the `/profile/<username>/` page returns 404 for an unknown username'
+        )
@@ -0,0 +1,62 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from posts.models import Post
+
+from tests.utils import get_field_from_context, get_queries_count
+
+
+class TestFeedQueries:
+    # Session, user, group or author lookup, post count and the page of posts, plus one spare
+    max_queries = 6
+
+    @pytest.mark.django_db(transaction=True)
+    def test_feed_queries_budget(self, user_client, mixer, post_with_group):
+        # Logged-in users bypass the page cache, so every load renders the page
+        urls = [
+            '/',
+            f'/group/{post_with_group.group.slug}/',
+            f'/profile/{post_with_group.author.username}/',
+        ]
+        budget = {url: get_queries_count(user_client, url) for url in urls}
+
+        mixer.cycle(19).blend(Post, author=post_with_group.author, group=post_with_group.group)
+        for url in urls:
+            queries = get_queries_count(user_client, url)
+            assert queries <= budget[url], (
+                f'The `{url}` page makes {queries} database queries for a page of 10 posts '
+                f'and {budget[url]} for a page of 1 post. '
+                'Make sure that the author and the group of the posts are loaded with `select_related`'
+            )
+            assert queries <= self.max_queries, (
+                f'The `{url}` page makes {queries} database queries, '
+                f'but it needs no more than {self.max_queries}. '
+                'Make sure that the page does not make extra queries'
+            )
+
+
+class TestPostDetailQueries:
+    # The post with its author and group, the author's post count,
+    # and the previous and next posts of the group
+    max_queries = 4
+
+    @pytest.mark.django_db(transaction=True)
+    def test_post_detail_queries_budget(self, client, mixer, post_with_group):
+        mixer.cycle(19).blend(Post, author=post_with_group.author, group=post_with_group.group)
+        url = f'/posts/{post_with_group.id}/'
+        queries = get_queries_count(client, url)
+        assert queries <= self.max_queries, (
+            f'The `{url}` page makes {queries} database queries, '
+            f'but it needs no more than {self.max_queries}. '
+            'Make sure that the post is loaded together with its author and group (`select_related`) '
+            'and that the author\'s posts are counted with a single query'
+        )
+
+        post = get_field_from_context(client.get(url).context, Post)
+        with CaptureQueriesContext(connection) as context:
+            post.author.username
+            post.group.title
+        assert not context.captured_queries, (
+            f'Make sure that the post on the `{url}` page is loaded together '
+            'with its author and group (`select_related`)'
+        )
@@ -1,4 +1,6 @@
+from django.db import connection
 from django.template.context import RequestContext
+from django.test.utils import CaptureQueriesContext
 
 
 def get_field_from_context(context, field_type):
@@ -8,3 +10,10 @@ def get_field_from_context(context, field_type):
         if field not in ('user', 'request') and isinstance(context[field], field_type):
             return context[field]
     return
+
+
+def get_queries_count(client, url):
+    """Return the number of database queries made while loading the page."""
+    with CaptureQueriesContext(connection) as context:
+        client.get(url)
+    return len(context.captured_queries)